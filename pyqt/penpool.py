@@ -0,0 +1,17 @@
+import functools
+import pyqtgraph as pg
+
+SOLID_LINE = pg.QtCore.Qt.PenStyle.SolidLine
+
+# NOTE: Pens and brushes returned here are shared across every caller, so they must
+#       be treated as read-only. Copy them (QPen(pen)) before calling any setters.
+
+@functools.lru_cache(maxsize=128)
+def pen(r, g, b, a=255, width=1, style=SOLID_LINE):
+    """Return a shared QPen for the given color, width and style"""
+    return pg.mkPen(color=(r, g, b, a), width=width, style=style)
+
+@functools.lru_cache(maxsize=128)
+def brush(r, g, b, a=255):
+    """Return a shared QBrush for the given color"""
+    return pg.mkBrush(r, g, b, a)
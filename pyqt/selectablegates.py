@@ -1,12 +1,16 @@
 import pyqtgraph as pg
 from pyqtgraph.graphicsItems.ROI import Handle
 from PyQt6.QtWidgets import QMainWindow, QApplication, QVBoxLayout, QWidget
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPainter
 import numpy as np
 import types
 from enum import Enum, auto
 import sys
+import penpool
+
+# Shared so ScatterPlotItem's brush cache recognizes it across updates
+SCATTER_BRUSH = penpool.brush(30, 30, 200, 50)
 
 class GateType(Enum):
     RECTANGLE = auto()
@@ -17,7 +21,7 @@ class Gate:
     def __init__(self, pos, size, pen=None):
         self.pos = pos
         self.size = size
-        self.pen = pen or pg.mkPen('k', width=2)
+        self.pen = pen or penpool.pen(0, 0, 0, width=2)
         self.roi = None
         
     def create(self):
@@ -32,8 +36,8 @@ class Gate:
             
             def enhanced_paint(self, p, opt, widget):
                 original_paint(p, opt, widget)
-                p.setBrush(pg.mkBrush(0, 0, 0, 255))
-                p.setPen(pg.mkPen(0, 0, 0, 255))
+                p.setBrush(penpool.brush(0, 0, 0, 255))
+                p.setPen(penpool.pen(0, 0, 0, 255))
                 p.drawPath(self.shape())
 
             handle.paint = types.MethodType(enhanced_paint, handle)
@@ -54,6 +58,12 @@ class EllipseGate(Gate):
         self.enhance_handles()
         return self.roi
 
+def custom_paint(self, p, opt, widget):
+    """Paint a handle with its current pen/brush; Handle.shape() caches its own path"""
+    p.setPen(self._pen)
+    p.setBrush(self._brush)
+    p.drawPath(self.shape())
+
 class SelectableROI(pg.RectROI):
     """Custom ROI that changes handle opacity based on selection state"""
     
@@ -66,19 +76,12 @@ class SelectableROI(pg.RectROI):
         """Make handles semi-transparent"""
         for h in self.getHandles():
             # Create a semi-transparent black pen
-            dim_pen = pg.mkPen(0, 0, 0, opacity)
-            dim_brush = pg.mkBrush(0, 0, 0, opacity)
+            dim_pen = penpool.pen(0, 0, 0, opacity)
+            dim_brush = penpool.brush(0, 0, 0, opacity)
             
             # Store the original paint method if not already stored
             if not hasattr(h, '_original_paint'):
                 h._original_paint = h.paint
-                
-                # Create a custom paint method
-                def custom_paint(self, p, opt, widget):
-                    p.setPen(self._pen)
-                    p.setBrush(self._brush)
-                    p.drawPath(self.shape())
-                
                 h.paint = types.MethodType(custom_paint, h)
             
             # Store the current appearance
@@ -92,8 +95,8 @@ class SelectableROI(pg.RectROI):
         """Make handles fully visible"""
         for h in self.getHandles():
             # Create a fully opaque black pen
-            bright_pen = pg.mkPen(0, 0, 0, opacity)
-            bright_brush = pg.mkBrush(0, 0, 0, opacity)
+            bright_pen = penpool.pen(0, 0, 0, opacity)
+            bright_brush = penpool.brush(0, 0, 0, opacity)
             
             # Update the appearance
             h._pen = bright_pen
@@ -127,19 +130,12 @@ class SelectableEllipseROI(pg.EllipseROI):
     def dimHandles(self, opacity=30):
         for h in self.getHandles():
             # Create a semi-transparent black pen
-            dim_pen = pg.mkPen(0, 0, 0, opacity)
-            dim_brush = pg.mkBrush(0, 0, 0, opacity)
+            dim_pen = penpool.pen(0, 0, 0, opacity)
+            dim_brush = penpool.brush(0, 0, 0, opacity)
             
             # Store the original paint method if not already stored
             if not hasattr(h, '_original_paint'):
                 h._original_paint = h.paint
-                
-                # Create a custom paint method
-                def custom_paint(self, p, opt, widget):
-                    p.setPen(self._pen)
-                    p.setBrush(self._brush)
-                    p.drawPath(self.shape())
-                
                 h.paint = types.MethodType(custom_paint, h)
             
             # Store the current appearance
@@ -152,8 +148,8 @@ class SelectableEllipseROI(pg.EllipseROI):
     def highlightHandles(self, opacity=255):
         for h in self.getHandles():
             # Create a fully opaque black pen
-            bright_pen = pg.mkPen(0, 0, 0, opacity)
-            bright_brush = pg.mkBrush(0, 0, 0, opacity)
+            bright_pen = penpool.pen(0, 0, 0, opacity)
+            bright_brush = penpool.brush(0, 0, 0, opacity)
             
             # Update the appearance
             h._pen = bright_pen
@@ -178,10 +174,24 @@ class SelectableEllipseROI(pg.EllipseROI):
 
 class SelectableGateViewBox(pg.ViewBox):
     """ViewBox that handles ROI selection/deselection"""
+
+    # Class-level defaults: ViewBox.__init__ may call updateAutoRange before ours runs
+    _defer_auto_range = False
+    _auto_range_scheduled = False
     
     def __init__(self, parent=None, border=None, lockAspect=False, enableMenu=True):
         super().__init__(parent, border, lockAspect, enableMenu)
         self.current_selected_roi = None
+
+    def updateAutoRange(self):
+        """Skip auto-range while ROIs are being added; a single update runs afterwards"""
+        if self._defer_auto_range:
+            return
+        super().updateAutoRange()
+
+    def _deferredAutoRange(self):
+        self._auto_range_scheduled = False
+        self.updateAutoRange()
         
     def addROI(self, roi_type, pos=None, size=None):
         """Add a new ROI of specified type"""
@@ -195,11 +205,19 @@ class SelectableGateViewBox(pg.ViewBox):
             size = [100, 100]
             
         if roi_type == 'rect':
-            roi = SelectableROI(pos=pos, size=size, pen=pg.mkPen('r', width=2))
+            roi = SelectableROI(pos=pos, size=size, pen=penpool.pen(255, 0, 0, width=2))
         elif roi_type == 'ellipse':
-            roi = SelectableEllipseROI(pos=pos, size=size, pen=pg.mkPen('r', width=2))
+            roi = SelectableEllipseROI(pos=pos, size=size, pen=penpool.pen(255, 0, 0, width=2))
         
-        self.addItem(roi)
+        # Batched additions share one auto-range pass on the next event loop turn
+        self._defer_auto_range = True
+        try:
+            self.addItem(roi)
+        finally:
+            self._defer_auto_range = False
+        if not self._auto_range_scheduled:
+            self._auto_range_scheduled = True
+            QTimer.singleShot(0, self._deferredAutoRange)
         roi.sigClicked.connect(self.onROIClicked)
         
         # Make sure ROI can receive mouse clicks
@@ -258,7 +276,7 @@ class MainWindow(QMainWindow):
             x=np.concatenate([x1, x2]), 
             y=np.concatenate([y1, y2]),
             pen=None, 
-            brush=pg.mkBrush(30, 30, 200, 50),
+            brush=SCATTER_BRUSH,
             size=10
         )
         self.plot.addItem(self.scatter)
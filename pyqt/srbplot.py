@@ -1,14 +1,22 @@
-from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QGraphicsItem
 from PySide6.QtGui import QTransform
 
-import pyqt as pg
+import pyqtgraph as pg
 import numpy as np
 
 from colormaps.colormaps import COLORMAPS
 
+# Lets ImageItem.setImage take (rows, cols) C-contiguous data without an internal transpose
+pg.setConfigOptions(imageAxisOrder='row-major')
+
 LOG_MIN = 0
 LOG_MAX = 8
 
+# Built once and shared by every ribbon image
+_TURBO_CMAP = pg.ColorMap(color=COLORMAPS['turbo']['colors'], pos=COLORMAPS['turbo']['positions'])
+_TURBO_LEN = len(COLORMAPS['turbo']['colors'])
+_TURBO_LUT = _TURBO_CMAP.getLookupTable(alpha=True)
+
 def setup_plot(plot: pg.PlotWidget):
     plot.getPlotItem().setLogMode(x=False, y=True)  # Enable log mode for the y-axis
     plot.setMouseEnabled(x=False, y=False)  # Disable mouse interaction for x-axis
@@ -18,37 +26,38 @@ def setup_plot(plot: pg.PlotWidget):
     plot.getPlotItem().showGrid(x=True, y=False)  # Show grid for better visibility
 
 def setup_image(image: pg.ImageItem):
-    color_map = pg.ColorMap(color=COLORMAPS['turbo']['colors'], pos=COLORMAPS['turbo']['positions'])
-    image.setColorMap(color_map)
-    image.setLevels((0, len(COLORMAPS['turbo']['colors'])))
-    image.setLookupTable(color_map.getLookupTable(alpha=True))
+    image.setColorMap(_TURBO_CMAP)
+    image.setLevels((0, _TURBO_LEN))
+    image.setLookupTable(_TURBO_LUT)
+    image.setAutoDownsample(True)  # 1024 bins is usually more than the on-screen height
+    # The image is static, so overlays and cursor moves shouldn't re-rasterize it
+    image.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
 def generate_data():
-    data = np.zeros((51, 1024))  # Initialize data array for 10 ribbons
+    num_ribbons, num_bins = 51, 1024
+    # Row-major (bins, ribbons): rows map to y, columns to x, matching imageAxisOrder
+    data = np.zeros((num_bins, num_ribbons), order='C')  # Initialize data array for all ribbons
 
-    # Create pattern across ribbons
-    for i in range(51):
-        # Vary number of active bins in a pattern
-        num_bins = 1024
+    # Build every ribbon at once; cols is the ribbon index broadcast across bins
+    cols = np.arange(num_ribbons)
 
-        # Create positions with increasing spread for higher ribbon numbers
-        positions = np.linspace(100, 900, num_bins) 
-        positions += np.random.normal(0, i*5, num_bins)  # Add noise proportional to ribbon index
-        positions = np.clip(positions, 0, 1023).astype(int)  # Ensure in valid range
+    # Create positions with increasing spread for higher ribbon numbers
+    positions = np.linspace(100, 900, num_bins)[:, None] + np.random.normal(0, cols * 5, (num_bins, num_ribbons))
+    positions = np.clip(positions, 0, num_bins - 1).astype(int)  # Ensure in valid range
 
-        # Vary amplitudes in a pattern 
-        amplitudes = 4 + 3 * np.cos(positions/200) + i/2  # Amplitude varies by position and ribbon
+    # Vary amplitudes in a pattern 
+    amplitudes = 4 + 3 * np.cos(positions/200) + cols/2  # Amplitude varies by position and ribbon
 
-        # Set values
-        for pos, amp in zip(positions, amplitudes):
-            data[i, pos] = amp * 50
+    # Set values
+    data[positions, np.broadcast_to(cols, positions.shape)] = amplitudes * 50
 
     # Add some interesting features
-    data[2, 300:350] = np.linspace(0, 9, 50)  # Ramp in ribbon 3
-    data[7, 700:800] = 8 * np.sin(np.linspace(0, 4*np.pi, 100))  # Sine wave in ribbon 8
-    data[4, 400:600:5] = 7  # Dotted line in ribbon 5
+    data[300:350, 2] = np.linspace(0, 9, 50)  # Ramp in ribbon 3
+    data[700:800, 7] = 8 * np.sin(np.linspace(0, 4*np.pi, 100))  # Sine wave in ribbon 8
+    data[400:600:5, 4] = 7  # Dotted line in ribbon 5
 
-    return data
+    # Shift the sine's negative half up instead of clipping it; auto-levels render the same image
+    return np.rint(data - data.min()).astype(np.uint16)
 
 
 def transform_image(image: pg.ImageItem):
@@ -2,9 +2,36 @@ import sys
 import platform
 import ctypes
 from PySide6.QtWidgets import QApplication, QMainWindow, QTextEdit, QVBoxLayout, QWidget, QPushButton
-from PySide6.QtCore import QRect, Qt, QCoreApplication, QSize, QSizeF
+from PySide6.QtCore import QRect, Qt, QCoreApplication, QSize, QSizeF, QTimer
 from PySide6.QtGui import QScreen, QGuiApplication, QFont
 
+# Resolve the Win32 DPI functions once instead of on every refresh
+if platform.system() == "Windows":
+    from ctypes import c_int, c_uint, c_long, c_void_p, POINTER
+
+    _user32 = ctypes.windll.user32
+    _shcore = ctypes.windll.shcore
+
+    _GetThreadDpiAwarenessContext = _user32.GetThreadDpiAwarenessContext
+    _GetThreadDpiAwarenessContext.argtypes = []
+    _GetThreadDpiAwarenessContext.restype = c_void_p
+
+    _GetAwarenessFromDpiAwarenessContext = _user32.GetAwarenessFromDpiAwarenessContext
+    _GetAwarenessFromDpiAwarenessContext.argtypes = [c_void_p]
+    _GetAwarenessFromDpiAwarenessContext.restype = c_int
+
+    _GetDpiForSystem = _user32.GetDpiForSystem
+    _GetDpiForSystem.argtypes = []
+    _GetDpiForSystem.restype = c_uint
+
+    _MonitorFromWindow = _user32.MonitorFromWindow
+    _MonitorFromWindow.argtypes = [c_void_p, c_uint]
+    _MonitorFromWindow.restype = c_void_p
+
+    _GetDpiForMonitor = _shcore.GetDpiForMonitor
+    _GetDpiForMonitor.argtypes = [c_void_p, c_int, POINTER(c_uint), POINTER(c_uint)]
+    _GetDpiForMonitor.restype = c_long
+
 class MonitorInfoWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -25,14 +52,57 @@ class MonitorInfoWindow(QMainWindow):
         refresh_button = QPushButton("Refresh Information")
         refresh_button.clicked.connect(self.gather_display_info)
         layout.addWidget(refresh_button)
+
+        # Create save button
+        save_button = QPushButton("Save to File")
+        save_button.clicked.connect(self.save_display_info)
+        layout.addWidget(save_button)
         
         self.setCentralWidget(central_widget)
         
+        # Screen, DPI and system information is cached between refreshes and only rebuilt
+        # when a screen is added/removed or its geometry, DPI or refresh rate changes
+        self._static_info_str = self._static_info()
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._schedule_static_rebuild)
+        app.primaryScreenChanged.connect(self._schedule_static_rebuild)
+        for screen in QGuiApplication.screens():
+            self._watch_screen(screen)
+
         # Gather and display information
         self.gather_display_info()
     
     def gather_display_info(self):
         """Gather and display all monitor/screen information"""
+        self.text_display.setPlainText("\n".join((self._static_info_str, self._dynamic_info())))
+
+    def save_display_info(self):
+        """Save the displayed information to a file"""
+        with open("monitor_info.txt", "w") as f:
+            f.write(self.text_display.toPlainText())
+        print("Information saved to monitor_info.txt")
+
+    def _watch_screen(self, screen):
+        screen.geometryChanged.connect(self._schedule_static_rebuild)
+        screen.logicalDotsPerInchChanged.connect(self._schedule_static_rebuild)
+        screen.physicalDotsPerInchChanged.connect(self._schedule_static_rebuild)
+        screen.refreshRateChanged.connect(self._schedule_static_rebuild)
+
+    def _on_screen_added(self, screen):
+        self._watch_screen(screen)
+        self._schedule_static_rebuild()
+
+    def _schedule_static_rebuild(self, *args):
+        # Deferred so QGuiApplication.screens() is up to date when a screen is removed
+        QTimer.singleShot(0, self._rebuild_static_info)
+
+    def _rebuild_static_info(self):
+        self._static_info_str = self._static_info()
+        self.gather_display_info()
+
+    def _static_info(self):
+        """Build the system, screen and DPI sections, cached until the screen setup changes"""
         info = []
         
         # System information
@@ -95,8 +165,7 @@ class MonitorInfoWindow(QMainWindow):
             info.append("=== WINDOWS DPI AWARENESS ===")
             try:
                 # Get DPI awareness context
-                awareness = ctypes.windll.user32.GetAwarenessFromDpiAwarenessContext(
-                    ctypes.windll.user32.GetThreadDpiAwarenessContext())
+                awareness = _GetAwarenessFromDpiAwarenessContext(_GetThreadDpiAwarenessContext())
                 
                 awareness_types = {
                     0: "DPI_AWARENESS_UNAWARE",
@@ -107,17 +176,16 @@ class MonitorInfoWindow(QMainWindow):
                 info.append(f"DPI Awareness: {awareness_str}")
                 
                 # Get system DPI
-                user32 = ctypes.windll.user32
-                system_dpi_x = user32.GetDpiForSystem()
+                system_dpi_x = _GetDpiForSystem()
                 info.append(f"System DPI: {system_dpi_x}")
                 
                 # Try to get DPI for the monitor
                 try:
-                    monitor = user32.MonitorFromWindow(0, 0)  # MONITOR_DEFAULTTOPRIMARY
+                    monitor = _MonitorFromWindow(None, 0)  # MONITOR_DEFAULTTOPRIMARY
                     dpi_type = 0  # MDT_EFFECTIVE_DPI
                     dpiX = ctypes.c_uint()
                     dpiY = ctypes.c_uint()
-                    res = ctypes.windll.shcore.GetDpiForMonitor(monitor, dpi_type, ctypes.byref(dpiX), ctypes.byref(dpiY))
+                    res = _GetDpiForMonitor(monitor, dpi_type, ctypes.byref(dpiX), ctypes.byref(dpiY))
                     if res == 0:  # S_OK
                         info.append(f"Monitor Effective DPI: {dpiX.value}x{dpiY.value}")
                 except Exception as e:
@@ -144,7 +212,13 @@ class MonitorInfoWindow(QMainWindow):
         info.append(f"Depth: {primary_screen.depth()} bits")
         refresh_rate = primary_screen.refreshRate()
         info.append(f"Refresh Rate: {refresh_rate:.2f} Hz")
-        
+
+        return "\n".join(info)
+
+    def _dynamic_info(self):
+        """Build the virtual desktop and window sections, which change on every refresh"""
+        info = []
+
         # Virtual desktop information
         virtual_geometry = QGuiApplication.primaryScreen().virtualGeometry()
         info.append("")
@@ -160,14 +234,8 @@ class MonitorInfoWindow(QMainWindow):
         info.append(f"Window position: {self.x()},{self.y()}")
         client_area = self.rect()
         info.append(f"Client area: {client_area.width()}x{client_area.height()} pixels")
-        
-        # Display the information
-        self.text_display.setPlainText("\n".join(info))
-        
-        # Save to file
-        with open("monitor_info.txt", "w") as f:
-            f.write("\n".join(info))
-        print("Information saved to monitor_info.txt")
+
+        return "\n".join(info)
 
 
 def test_font_rendering():
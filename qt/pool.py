@@ -0,0 +1,13 @@
+class ObjectPool:
+    """Reuse frequently allocated draw objects (QLineF, QPointF, ...) instead of rebuilding them per frame"""
+    def __init__(self, factory, size=0):
+        self.factory = factory
+        self.pool = [factory() for _ in range(size)]
+
+    def get(self):
+        """Take an object from the pool, creating a new one if the pool is empty"""
+        return self.pool.pop() if self.pool else self.factory()
+
+    def release(self, obj):
+        """Return an object to the pool so it can be handed out again"""
+        self.pool.append(obj)
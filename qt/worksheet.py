@@ -1,15 +1,20 @@
-from PySide6.QtWidgets import (QGraphicsScene, QGraphicsView, QMainWindow, QApplication,
-                              QMenu, QGraphicsItem, QPushButton, QGraphicsProxyWidget)
-from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QPen, QColor
+from PySide6.QtWidgets import (QGraphicsView, QMainWindow, QApplication,
+                              QMenu, QGraphicsItem, QPushButton, QGraphicsRectItem, QWidget)
+from PySide6.QtCore import Qt, QRectF, QPointF, QLineF
+from PySide6.QtGui import QPen, QColor, QPainter
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from loguru import logger
 import configparser as cfp
-from pyqt.plot import Plot
+import pyqtgraph as pg
+from qt.pool import ObjectPool
+
+# Number of plots at which the worksheet view switches to an OpenGL viewport
+GL_PLOT_THRESHOLD = 4
 
 class Worksheet(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.scene = WorksheetScene(self)
+        self.scene = WorksheetScene(parent=self)
         self.view = WorksheetView(self)
         self.setCentralWidget(self.view)
         self.view.setScene(self.scene)
@@ -31,28 +36,72 @@ class Worksheet(QMainWindow):
         self.context_menu.exec(self.view.mapToGlobal(position))
 
     def add_new_plot(self, plot_type):
-        plot = Plot()
+        plot = PlotFrame()
 
         view_center = self.view.mapToScene(self.view.viewport().rect().center())
         
-        proxy = self.scene.addWidget(plot)
-        proxy.setPos(view_center)
-        proxy.setFlag(QGraphicsItem.ItemIsMovable, True)
-        proxy.setFlag(QGraphicsItem.ItemIsSelectable, True)
-        proxy.setFlag(QGraphicsItem.ItemIsFocusable, True)
+        self.scene.addItem(plot)
+        plot.setPos(view_center)
+
+        self.scene.plot_count += 1
+        if self.scene.plot_count >= GL_PLOT_THRESHOLD:
+            self.view.set_opengl(True)
     
     def clear_scene(self):
         for item in self.scene.items():
-            if isinstance(item, QGraphicsProxyWidget):
-                item.widget().close()
+            if isinstance(item, PlotFrame):
+                self.scene.removeItem(item)
+        self.scene.plot_count = 0
+        self.view.set_opengl(False)
+
+class PlotFrame(QGraphicsRectItem):
+    """Movable frame hosting a native pyqtgraph PlotItem, so plots don't go through a QGraphicsProxyWidget"""
+    def __init__(self, width=800, height=600, margin=10):
+        super().__init__(0, 0, width, height)
+        self.setBrush(QColor(255, 255, 255))
+        self.setPen(QPen(QColor(0, 0, 0)))
+
+        # The frame margin is the drag handle; the plot itself keeps its pan/zoom interaction
+        self.setFlag(QGraphicsItem.ItemIsMovable, True)
+        self.setFlag(QGraphicsItem.ItemIsSelectable, True)
+        self.setFlag(QGraphicsItem.ItemIsFocusable, True)
+
+        self.plot = pg.PlotItem(parent=self)
+        self.plot.setGeometry(QRectF(margin, margin, width - 2 * margin, height - 2 * margin))
+        self.plot.showGrid(True, True)
+        self.plot.getViewBox().setBackgroundColor('w')
+
+        # Same ROI and hooks as pyqt/plot.py's Plot, to check ROI mouse handling inside the worksheet
+        self.roi = pg.RectROI([0, 0], [1, 1], pen='r')
+        self.roi.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)
+        self.roi.sigClicked.connect(lambda: print("Clicked"))
+        self.roi.sigHoverEvent.connect(lambda: print("Hovering"))
+        self.roi.sigRegionChangeStarted.connect(lambda: print("Region change started"))
+        self.roi.sigRegionChangeFinished.connect(lambda: print("Region change ended"))
+        self.plot.addItem(self.roi)
+
+    def contains_plot_point(self, pos):
+        """True if pos (in frame coordinates) is over the plot rather than the frame margin"""
+        return self.plot.geometry().contains(pos)
+
+    def mousePressEvent(self, event):
+        # Presses over the plot are ignored so the frame never becomes the mouse grabber;
+        # pg.GraphicsScene only delivers its drag/click events to the ROI and ViewBox when nothing is grabbing
+        if self.contains_plot_point(event.pos()):
+            event.ignore()
+            return
+        super().mousePressEvent(event)
 
-class WorksheetScene(QGraphicsScene):
+# NOTE: pg.GraphicsScene is required for the PlotItem's mouse interaction to work.
+class WorksheetScene(pg.GraphicsScene):
     def __init__(self, parent=None):
-        super().__init__(parent)
+        super().__init__(parent=parent)
         self.pageWidth = 850
         self.pageHeight = 1100
         self.horizontal_pages = 2
         self.vertical_pages = 1
+        self.plot_count = 0
+        self.line_pool = ObjectPool(QLineF, self.horizontal_pages + self.vertical_pages + 2)
         self.updateSceneRect()
             
     def updateSceneRect(self):
@@ -69,22 +118,60 @@ class WorksheetScene(QGraphicsScene):
         page_pen.setStyle(Qt.DashLine)
         painter.setPen(page_pen)
         
+        lines = []
         for i in range(self.horizontal_pages + 1):
             x = i * self.pageWidth
-            painter.drawLine(x, rect.top(), x, rect.bottom())
+            line = self.line_pool.get()
+            line.setLine(x, rect.top(), x, rect.bottom())
+            lines.append(line)
         
         for i in range(self.vertical_pages + 1):
             y = i * self.pageHeight
-            painter.drawLine(rect.left(), y, rect.right(), y)
+            line = self.line_pool.get()
+            line.setLine(rect.left(), y, rect.right(), y)
+            lines.append(line)
+
+        painter.drawLines(lines)
+        for line in lines:
+            self.line_pool.release(line)
 
 class WorksheetView(QGraphicsView):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, use_opengl=False):
         super().__init__(parent)
+        # NOTE: An OpenGL viewport moves scene compositing to the GPU, which only pays off once
+        #       the worksheet holds several plots; for one or two plots the GL context costs more
+        #       than it saves. It is off by default and Worksheet turns it on at GL_PLOT_THRESHOLD.
+        self.uses_opengl = False
+        self.set_opengl(use_opengl)
+        self.setRenderHint(QPainter.Antialiasing, False)
         self.setDragMode(QGraphicsView.ScrollHandDrag)
-        self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
+    def set_opengl(self, enabled):
+        """Switch the viewport between an OpenGL widget and the default raster widget"""
+        if enabled == self.uses_opengl:
+            return
+        self.setViewport(QOpenGLWidget() if enabled else QWidget())
+        self.uses_opengl = enabled
+
+    def mousePressEvent(self, event):
+        # Presses over a plot are left unaccepted for pyqtgraph, which would otherwise start
+        # ScrollHandDrag and scroll the scene while the ROI or ViewBox is being dragged
+        pos = event.position().toPoint()
+        item = self.itemAt(pos)
+        frame = item.topLevelItem() if item is not None else None
+        if isinstance(frame, PlotFrame) and frame.contains_plot_point(frame.mapFromScene(self.mapToScene(pos))):
+            self.setDragMode(QGraphicsView.NoDrag)
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+
 
 if __name__ == '__main__':
     app = QApplication([])
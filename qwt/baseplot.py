@@ -1,25 +1,10 @@
 import sys
-from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
-from plotpy.plot import BasePlot
-import numpy as np
-
-class Plot(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Base Plot")
-        self.setGeometry(100, 100, 800, 600)
-
-        # Create the main widget and layout
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        layout = QVBoxLayout(main_widget)
-
-        # Create PlotWidget
-        self.plot = BasePlot()
-        layout.addWidget(self.plot)
+from PySide6.QtWidgets import QApplication
+from plot import Plot, setup_gl_context
 
 if __name__ == '__main__':
+    setup_gl_context()
     app = QApplication(sys.argv)
-    window = Plot()
+    window = Plot(with_tools=False)
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,37 +1,25 @@
 import sys
-from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
-from plotpy.plot import BasePlot
+from PySide6.QtWidgets import QApplication
 from plotpy.items import XYImageItem
 from plotpy.styles import XYImageParam
 import numpy as np
+from plot import Plot, setup_gl_context
 
-class Plot(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Base Plot")
-        self.setGeometry(100, 100, 800, 600)
-
-        # Create the main widget and layout
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        layout = QVBoxLayout(main_widget)
-
-        # Create PlotWidget
-        self.plot = BasePlot()
-        layout.addWidget(self.plot)
-
-        wavelengths = np.array([400, 500, 600, 700])  # Example wavelengths as NumPy array
-
-
-        self.image = XYImageItem(x=wavelengths, y=np.linspace(0, 100, 100), data=np.random.normal(size=(4, 4)),
-                                 param=XYImageParam())
-
-        self.plot.add_item(self.image)
+# Shared generator, so each new image doesn't seed its own RNG
+_RNG = np.random.default_rng()
 
+def make_image():
+    wavelengths = np.array([400, 500, 600, 700], dtype=np.float32)  # Example wavelengths as NumPy array
 
+    # float32, C-contiguous (rows, cols) so the image item doesn't upcast/copy on the way to QImage
+    data = np.empty((4, 4), dtype=np.float32, order='C')
+    _RNG.standard_normal(out=data, dtype=np.float32)
+    y = np.arange(100, dtype=np.float32) * (100.0 / 99.0)  # Same points as np.linspace(0, 100, 100)
+    return XYImageItem(x=wavelengths, y=y, data=data, param=XYImageParam())
 
 if __name__ == '__main__':
+    setup_gl_context()
     app = QApplication(sys.argv)
-    window = Plot()
+    window = Plot(with_tools=False, image=make_image())
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -2,8 +2,13 @@ from qwt import QwtScaleDiv, QwtScaleDraw, QwtText
 from qwt.scale_engine import QwtScaleEngine
 from qwt.transform import QwtTransform
 import numpy as np
+import math
 
 LOG_MIN, LOG_MAX = 1, 10**8
+MAJOR_TICKS = [10**i for i in range(9)]
+MINOR_TICKS = [base * j for i in range(8) for base in [10**i] for j in range(2, 10)]
+# Qwt keeps transforming the same tick values, so their log10 is computed once here
+_TICK_LOG10 = {v: math.log10(v) for v in MAJOR_TICKS + MINOR_TICKS}
 
 class Log10ScaleDraw(QwtScaleDraw):
     def __init__(self):
@@ -24,10 +29,18 @@ class Log10Transform(QwtTransform):
         super().__init__()
         self.LogMin, self.LogMax = LOG_MIN, LOG_MAX
 
-    def bounded(self, value): return np.clip(value, self.LogMin, self.LogMax)
+    # Qwt calls these per tick with plain floats; lists, tuples and arrays go through NumPy.
+    def bounded(self, value):
+        if not np.isscalar(value): return np.clip(value, self.LogMin, self.LogMax)
+        return min(max(value, self.LogMin), self.LogMax)
+
     def copy(self): return Log10Transform()
     def invTransform(self, value): return 10**self.bounded(value)
-    def transform(self, value): return np.log10(self.bounded(value))
+
+    def transform(self, value):
+        if not np.isscalar(value): return np.log10(self.bounded(value))
+        cached = _TICK_LOG10.get(value)
+        return cached if cached is not None else math.log10(self.bounded(value))
 
 class Log10ScaleEngine(QwtScaleEngine):
     def transformation(self): return Log10Transform()
@@ -35,6 +48,4 @@ class Log10ScaleEngine(QwtScaleEngine):
     
     def divideScale(self, x1, x2, maxMajor, maxMinor, stepSize=0):
         x1, x2 = LOG_MIN, LOG_MAX
-        major_ticks = [10**i for i in range(9)]
-        minor_ticks = [base * j for i in range(8) for base in [10**i] for j in range(2, 10)]
-        return QwtScaleDiv(x1, x2, minor_ticks, [], major_ticks)
\ No newline at end of file
+        return QwtScaleDiv(x1, x2, list(MINOR_TICKS), [], list(MAJOR_TICKS))
\ No newline at end of file
@@ -1,14 +1,28 @@
-from enum import auto
 import sys
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot, Signal
+from PySide6.QtGui import QSurfaceFormat
 from plotpy.plot import BasePlot, PlotManager
-from plotpy.tools import SelectTool, AnnotatedRectangleTool
 from log10 import Log10ScaleEngine, Log10ScaleDraw
-import numpy as np
+
+# Scale engines are stateless and can be shared by every axis. Scale draws can't: each one
+# tracks its own axis alignment and scale map, so they stay one per axis.
+_LOG10_ENGINE = Log10ScaleEngine()
+_ACTIONS_CTX = Qt.ContextMenuPolicy.ActionsContextMenu
+
+def setup_gl_context():
+    """Share one GL context across plot windows. Must run before the QApplication is created."""
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    fmt = QSurfaceFormat()
+    fmt.setSwapBehavior(QSurfaceFormat.DoubleBuffer)
+    fmt.setSwapInterval(0)  # Uncapped repaints, useful when profiling
+    QSurfaceFormat.setDefaultFormat(fmt)
 
 class Plot(QMainWindow):
-    def __init__(self):
+    """Base plot window shared by the qwt templates (baseplot.py, imageitem.py)"""
+    shape_finalized = Signal(object)
+
+    def __init__(self, *, log_x=False, log_y=False, with_tools=True, image=None):
         super().__init__()
         self.setWindowTitle("Base Plot")
         self.setGeometry(100, 100, 800, 600)
@@ -20,33 +34,60 @@ class Plot(QMainWindow):
 
         # Create PlotWidget
         self.plot = BasePlot()
-        self.plot.setAxisScaleEngine(BasePlot.yLeft, Log10ScaleEngine())
-        self.plot.setAxisScaleEngine(BasePlot.xBottom, Log10ScaleEngine())
-        self.plot.setAxisScaleDraw(BasePlot.yLeft, Log10ScaleDraw())
-        self.plot.setAxisScaleDraw(BasePlot.xBottom, Log10ScaleDraw())
+
+        # Batch the axis changes into a single replot
+        auto_replot = self.plot.autoReplot()
+        self.plot.setAutoReplot(False)
+        if log_y:
+            self.plot.setAxisScaleEngine(BasePlot.yLeft, _LOG10_ENGINE)
+            self.plot.setAxisScaleDraw(BasePlot.yLeft, Log10ScaleDraw())
+        if log_x:
+            self.plot.setAxisScaleEngine(BasePlot.xBottom, _LOG10_ENGINE)
+            self.plot.setAxisScaleDraw(BasePlot.xBottom, Log10ScaleDraw())
+        self.plot.setAutoReplot(auto_replot)
+        self.plot.replot()
         
         layout.addWidget(self.plot)
 
+        self.image = image
+        if image is not None:
+            self.plot.add_item(image)
+
+        if with_tools:
+            self.setup_tools()
+
+    def setup_tools(self):
         self.manager = PlotManager(self.plot)
         self.manager.add_plot(self.plot)
 
+        # Deferred: plotpy.tools pulls in a large dependency tree that only matters once tools are registered
+        from plotpy.tools import SelectTool, AnnotatedRectangleTool
         self.select_tool = self.manager.add_tool(SelectTool)
         self.select_tool.activate()
-        self.rect_tool = self.manager.add_tool(AnnotatedRectangleTool, handle_final_shape_cb=self.handle_final_shape, switch_to_default_tool=True)
+        # Selection updates run on the next event loop turn instead of inside the tool's dispatch
+        self.shape_finalized.connect(self.handle_final_shape, Qt.QueuedConnection)
+        self.rect_tool = self.manager.add_tool(AnnotatedRectangleTool, handle_final_shape_cb=self.shape_finalized.emit, switch_to_default_tool=True)
+
+        self.plot.setContextMenuPolicy(_ACTIONS_CTX)
+        self.plot.addAction("Add Rectangle", self.on_add_rectangle)
 
-        self.plot.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
-        self.plot.addAction("Add Rectangle", lambda: self.rect_tool.activate())
+    @Slot()
+    def on_add_rectangle(self):
+        self.rect_tool.activate()
 
+    @Slot(object)
     def handle_final_shape(self, shape):
         print(f"Final shape: {shape}")
         self.plot.unselect_all()
         self.plot.select_item(shape)
 
+    @Slot(object)
     def add_shape(self, tool):
         self.manager.get_tool(tool).activate()
 
 if __name__ == '__main__':
+    setup_gl_context()
     app = QApplication(sys.argv)
-    window = Plot()
+    window = Plot(log_x=True, log_y=True)
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -4,43 +4,53 @@ from qwt.transform import QwtTransform
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
-WAVELENGTHS = ["371nm", "382nm", "393nm", "404nm", "415nm"]
+WAVELENGTHS: tuple[str, ...] = ("371nm", "382nm", "393nm", "404nm", "415nm")
 
 
 class WavelengthTransform(QwtTransform):
     def transform(self, value): return value
     def invTransform(self, value): return value
-    def copy(self): return WavelengthTransform()
+    def copy(self): return self  # Stateless, so a copy is unnecessary
 
 class WavelengthScaleDraw(QwtScaleDraw):
     def __init__(self, wavelengths):
         super().__init__()
-        self.wavelengths = wavelengths
+        self.wavelengths = tuple(wavelengths)
         self.setLabelRotation(45)
         self.setLabelAlignment(Qt.AlignBottom)
         self.setSpacing(10)
         self.setPenWidth(1.5)
+
+        # Labels are fixed per wavelength, so build them once instead of on every repaint
+        self._font = QFont("Arial", 9)
+        self._font.setStyleStrategy(QFont.StyleStrategy.NoSubpixelAntialias | QFont.StyleStrategy.PreferQuality)
+        self._lut = {i: self._make(w) for i, w in enumerate(self.wavelengths)}
+        self._empty = QwtText("")
+
+    def _make(self, wavelength):
+        text = QwtText(wavelength)
+        text.setFont(self._font)
+        return text
     
     def label(self, value):
-        idx = int(round(value))
-        if 0 <= idx < len(self.wavelengths):
-            text = QwtText(self.wavelengths[idx])
-            text.setFont(QFont("Arial", 9))
-            return text
-        return QwtText("")
+        return self._lut.get(int(value + 0.5) if value >= 0 else int(value - 0.5), self._empty)
 
 class WavelengthScaleEngine(QwtScaleEngine):
     def __init__(self, wavelengths):
         super().__init__()
-        self.wavelengths = wavelengths
+        self.wavelengths = tuple(wavelengths)
         self.setAttribute(QwtScaleEngine.Floating, False)
         self.setAttribute(QwtScaleEngine.Symmetric, False)
         self.setAttribute(QwtScaleEngine.IncludeReference, True)
+
+        # The scale never changes after construction, so build it once
+        n = len(self.wavelengths)
+        self._x1, self._x2 = -1, n + 1
+        self._major = list(range(n))
+        self._div = QwtScaleDiv(self._x1, self._x2, [], [], self._major)
+        self._transform = WavelengthTransform()
+        self._auto = (self._x1, self._x2, 1.0)
     
-    def transformation(self): return WavelengthTransform()
-    def autoScale(self, maxNumSteps, x1, x2, stepSize): return -1, len(self.wavelengths) + 1, 1.0
-    
-    def divideScale(self, x1, x2, maxMajor, maxMinor, stepSize=0):
-        x1, x2 = -1, len(self.wavelengths) + 1
-        major_ticks = list(range(len(self.wavelengths)))
-        return QwtScaleDiv(x1, x2, [], [], major_ticks)
\ No newline at end of file
+    def transformation(self): return self._transform
+    def autoScale(self, maxNumSteps, x1, x2, stepSize): return self._auto
+    def divideScale(self, x1, x2, maxMajor, maxMinor, stepSize=0): return self._div
\ No newline at end of file
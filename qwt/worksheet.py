@@ -1,74 +1,13 @@
 import sys, numpy as np
+import torch
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QSizePolicy
-from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt
 from plotpy.plot import BasePlot
 from plotpy.items import ImageItem
 from plotpy.styles import ImageParam
-from qwt import QwtScaleDiv, QwtScaleDraw, QwtText
-from qwt.scale_engine import QwtScaleEngine
-from qwt.transform import QwtTransform
+from log10 import LOG_MIN, LOG_MAX, Log10ScaleEngine
+from wavelengths import WAVELENGTHS, WavelengthScaleDraw, WavelengthScaleEngine
 
-WAVELENGTHS = ["371nm", "382nm", "393nm", "404nm", "415nm"]
-LOG_MIN, LOG_MAX = 1, 10**8
-
-class WavelengthTransform(QwtTransform):
-    def transform(self, value): return value
-    def invTransform(self, value): return value
-    def copy(self): return WavelengthTransform()
-
-class WavelengthScaleDraw(QwtScaleDraw):
-    def __init__(self, wavelengths):
-        super().__init__()
-        self.wavelengths = wavelengths
-        self.setLabelRotation(45)
-        self.setLabelAlignment(Qt.AlignBottom)
-        self.setSpacing(10)
-        self.setPenWidth(1.5)
-    
-    def label(self, value):
-        idx = int(round(value))
-        if 0 <= idx < len(self.wavelengths):
-            text = QwtText(self.wavelengths[idx])
-            text.setFont(QFont("Arial", 9))
-            return text
-        return QwtText("")
-
-class WavelengthScaleEngine(QwtScaleEngine):
-    def __init__(self, wavelengths):
-        super().__init__()
-        self.wavelengths = wavelengths
-        self.setAttribute(QwtScaleEngine.Floating, False)
-        self.setAttribute(QwtScaleEngine.Symmetric, False)
-        self.setAttribute(QwtScaleEngine.IncludeReference, True)
-    
-    def transformation(self): return WavelengthTransform()
-    def autoScale(self, maxNumSteps, x1, x2, stepSize): return -1, len(self.wavelengths) + 1, 1.0
-    
-    def divideScale(self, x1, x2, maxMajor, maxMinor, stepSize=0):
-        x1, x2 = -1, len(self.wavelengths) + 1
-        major_ticks = list(range(len(self.wavelengths)))
-        return QwtScaleDiv(x1, x2, [], [], major_ticks)
-
-class Log10Transform(QwtTransform):
-    def __init__(self):
-        super().__init__()
-        self.LogMin, self.LogMax = LOG_MIN, LOG_MAX
-
-    def bounded(self, value): return np.clip(value, self.LogMin, self.LogMax)
-    def copy(self): return Log10Transform()
-    def invTransform(self, value): return 10**self.bounded(value)
-    def transform(self, value): return np.log10(self.bounded(value))
-
-class Log10ScaleEngine(QwtScaleEngine):
-    def transformation(self): return Log10Transform()
-    def autoScale(self, maxNumSteps, x1, x2, stepSize): return LOG_MIN, LOG_MAX, 1
-    
-    def divideScale(self, x1, x2, maxMajor, maxMinor, stepSize=0):
-        x1, x2 = LOG_MIN, LOG_MAX
-        major_ticks = [10**i for i in range(9)]
-        minor_ticks = [base * j for i in range(8) for base in [10**i] for j in range(2, 10)]
-        return QwtScaleDiv(x1, x2, minor_ticks, [], major_ticks)
+LOG_BINS_1024 = np.geomspace(LOG_MIN, LOG_MAX, 1024, dtype=np.float32)
 
 class MultiHistogramPlot(QMainWindow):
     def __init__(self, rotate=False):
@@ -86,7 +25,7 @@ class MultiHistogramPlot(QMainWindow):
         self.num_bins = 1024
         
         # Initialize data array based on orientation
-        self.initialH = np.zeros((self.num_bins, len(WAVELENGTHS)) if not self.rotate else (len(WAVELENGTHS), self.num_bins))
+        self.initialH = np.zeros((self.num_bins, len(WAVELENGTHS)) if not self.rotate else (len(WAVELENGTHS), self.num_bins), dtype=np.float32)
 
         # Configure image parameters
         self.image_param = ImageParam()
@@ -141,30 +80,43 @@ if __name__ == '__main__':
     window = MultiHistogramPlot(rotate=False)
     
     # Create logarithmic bins and generate sample data
-    log_bins = np.logspace(np.log10(LOG_MIN), np.log10(LOG_MAX), window.num_bins)
-    sample_data = np.zeros((len(WAVELENGTHS), window.num_bins-1) if window.rotate else (window.num_bins-1, len(WAVELENGTHS)))
+    log_bins = LOG_BINS_1024 if window.num_bins == 1024 else np.geomspace(LOG_MIN, LOG_MAX, window.num_bins, dtype=np.float32)
     
-    # Generate histogram data for each wavelength
-    for i in range(len(WAVELENGTHS)):
-        # Generate raw data with multiple peaks
-        num_samples = 100000
-        mean1, std1 = 10**(2 + i*0.7), 10**(2 + i*0.7) * 0.3
-        mean2, std2 = 10**(4 + i*0.5), 10**(4 + i*0.5) * 0.2
-        
-        # Create and combine samples
-        raw_data = np.abs(np.concatenate([
-            np.random.normal(mean1, std1, num_samples // 2),
-            np.random.normal(mean2, std2, num_samples // 2)
-        ]))
-        
-        # Create histogram with logarithmic bins
-        hist_values, _ = np.histogram(raw_data, bins=log_bins)
-        
-        # Store histogram values in appropriate orientation
-        if window.rotate:
-            sample_data[i, :] = hist_values
-        else:
-            sample_data[:, i] = hist_values
+    # Generate raw data for every wavelength at once, means broadcast over the channel axis
+    num_samples = 100000
+    rng = np.random.default_rng()
+    half = num_samples // 2
+    channels = np.arange(len(WAVELENGTHS))
+    means1 = 10**(2 + channels*0.7)
+    means2 = 10**(4 + channels*0.5)
+    # Fill one buffer with standard normals, then scale/shift each peak's half in place
+    raw_data = np.empty((len(WAVELENGTHS), num_samples), dtype=np.float32)
+    rng.standard_normal(dtype=np.float32, out=raw_data)
+    raw_data[:, :half] *= (means1 * 0.3)[:, None].astype(np.float32)
+    raw_data[:, :half] += means1[:, None].astype(np.float32)
+    raw_data[:, half:] *= (means2 * 0.2)[:, None].astype(np.float32)
+    raw_data[:, half:] += means2[:, None].astype(np.float32)
+    np.abs(raw_data, out=raw_data)
+
+    # Take log10 of every channel in a single in-place pass
+    np.maximum(raw_data, 1e-20, out=raw_data)
+    np.log10(raw_data, out=raw_data)
+
+    # Histogram all channels at once: bucketize against the log10 edges, then a batched
+    # bincount via scatter_add_ along the bin axis. Runs on the GPU when one is available.
+    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+    values = torch.from_numpy(raw_data).to(device)
+    edges = torch.from_numpy(np.log10(log_bins)).to(device=device, dtype=values.dtype)
+    idx = torch.bucketize(values, edges, right=True) - 1
+    idx.clamp_(0, window.num_bins - 2)
+    # Like np.histogram, drop values outside the edges and keep the last edge inclusive
+    inside = ((values >= edges[0]) & (values <= edges[-1])).to(values.dtype)
+    hist = torch.zeros((len(WAVELENGTHS), window.num_bins - 1), dtype=values.dtype, device=device)
+    hist.scatter_add_(1, idx, inside)
+    hist_values = hist.cpu().numpy()
+
+    # Store histogram values in appropriate orientation
+    sample_data = hist_values if window.rotate else np.ascontiguousarray(hist_values.T)
     
     # Update the plot with the histogram data
     window.hist.set_data(sample_data)
@@ -12,14 +12,52 @@ import pyqtgraph as pg
 import numpy as np
 import torch
 import uuid
+import functools
 from qwt import QwtText
 from loguru import logger
 from typing import Optional
 
+@functools.lru_cache(maxsize=64)
+def _make_axis_text(channel):
+    """Return the axis title for a channel, shared by every PseudocolorPlot"""
+    return QwtText.make(text=f"Channel {channel} Data", font=QFont('Segoe UI', 10, QFont.Bold))
+
+# (plot_config key, attribute path on the plot, caster or None to store as-is)
+_CONFIG_SCHEMA = (
+    # Settings that go to self.settings
+    ('identifier', 'settings.identifier', None),
+    ('identifier', 'id', None),
+    ('num_bins', 'settings.num_bins', int),
+    ('display_feature', 'settings.display_feature', None),
+    ('x_min_range', 'settings.x_min_range', None),
+    ('x_max_range', 'settings.x_max_range', None),
+    ('y_min_range', 'settings.y_min_range', None),
+    ('y_max_range', 'settings.y_max_range', None),
+    ('update_interval_ms', 'settings.update_interval_ms', int),
+    # Settings that go directly to self
+    ('x_feature', 'selected_x_channel', int),
+    ('y_feature', 'selected_y_channel', int),
+    ('logx', 'logx', int),
+    ('logy', 'logy', int),
+    ('stats_table', 'stats_table', int),
+    ('x_gain', 'x_gain', float),
+    ('y_gain', 'y_gain', float),
+    ('x_threshold', 'x_threshold', float),
+    ('y_threshold', 'y_threshold', float),
+)
+
+def _setattr_path(obj, path, value):
+    """setattr() that follows a dotted path, e.g. 'settings.num_bins'"""
+    *parents, name = path.split('.')
+    for parent in parents:
+        obj = getattr(obj, parent)
+    setattr(obj, name, value)
+
 class PseudocolorPlotSettings(QObject):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
+        self.update_interval_ms = 500
         # self.colormap = colormaps[0]
         # self.color_scale = 'linear'
         # self.x_scale = 'linear'
@@ -34,8 +72,8 @@ class PseudocolorPlotEventFilter(QObject):
     def eventFilter(self, watched, event):
         if event.type() == QEvent.Type.MouseButtonPress:
             if event.button() == Qt.RightButton:
-                # Get the PseudocolorPlot instance
-                plot = self.parent()
+                # One filter is shared by every plot, so find the plot from the watched object
+                plot = watched if isinstance(watched, PseudocolorPlot) else watched.parentWidget()
                 if not isinstance(plot, PseudocolorPlot):
                     return False
 
@@ -67,9 +105,12 @@ class PseudocolorPlot(QWidget):
     gate_added = Signal(object, str)
     gate_removed = Signal(object, str)
 
+    # The event filter holds no per-plot state, so all plots share one instance
+    _event_filter = None
+
     def __init__(self, config=None, parent=None, **kwargs):
         super().__init__(parent)
-        self.id = str(uuid.uuid4()).replace('-', '')
+        self.id = uuid.uuid4().hex
         self.name = f'pcolor_{self.id}'
         self.table_name = f'pcolor_{self.id}_cache'
 
@@ -77,6 +118,7 @@ class PseudocolorPlot(QWidget):
         self.setProperty("bypass-proxy", True)
 
         self.roi_dict = {}
+        self._features_dialog = None
         self.roi_labels = []
 
         # Add layout to hold the plot
@@ -84,7 +126,9 @@ class PseudocolorPlot(QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
         # # Create and install event filter
-        self.event_filter = PseudocolorPlotEventFilter(self)
+        if PseudocolorPlot._event_filter is None:
+            PseudocolorPlot._event_filter = PseudocolorPlotEventFilter()
+        self.event_filter = PseudocolorPlot._event_filter
         self.installEventFilter(self.event_filter)
 
         self.parent = parent
@@ -102,7 +146,7 @@ class PseudocolorPlot(QWidget):
         self.y_gain = 1
         self.x_threshold = 0
         self.y_threshold = 0
-        self.channel_indices = [] # NOTE: This should only matter for oscilloscope!
+        self.channel_indices = np.empty(0, dtype=np.int32) # NOTE: This should only matter for oscilloscope!
         
         self.stats_table = 0
 
@@ -123,9 +167,23 @@ class PseudocolorPlot(QWidget):
         self.setup_context_menu()
 
         # update timer
-        self.update_timer = QTimer()
+        # NOTE: The timer is started by on_plot_ready() once the backend is wired up and stopped
+        #       in closeEvent(), so idle plots don't wake the event loop.
+        self.update_timer = QTimer(self)
         # self.update_timer.timeout.connect(lambda: print('update timer timeout'))
-        self.update_timer.start(500) #NOTE: This is a placeholder value. Make it a controllable setting.
+
+    def start_updates(self, interval_ms=None):
+        """Start the periodic update timer, defaulting to settings.update_interval_ms"""
+        if interval_ms is not None:
+            self.settings.update_interval_ms = interval_ms
+        self.update_timer.start(self.settings.update_interval_ms)
+
+    def stop_updates(self):
+        self.update_timer.stop()
+
+    def closeEvent(self, event):
+        self.stop_updates()
+        super().closeEvent(event)
 
     def connect_signals(self):
         try:
@@ -141,61 +199,22 @@ class PseudocolorPlot(QWidget):
             return
         
         try:
-            # Apply settings that go to self.settings
-            if 'identifier' in self.plot_config:
-                self.settings.identifier = self.plot_config.get('identifier')
-                self.id = self.settings.identifier
+            for key, dest, cast in _CONFIG_SCHEMA:
+                if key in self.plot_config:
+                    value = self.plot_config[key]
+                    _setattr_path(self, dest, cast(value) if cast else value)
 
-            if 'num_bins' in self.plot_config:
-                self.settings.num_bins = self.plot_config.get('num_bins')
-            
-            if 'display_feature' in self.plot_config:
-                self.settings.display_feature = self.plot_config.get('display_feature')
-                
-            if 'x_min_range' in self.plot_config:
-                self.settings.x_min_range = self.plot_config.get('x_min_range')
-                
-            if 'x_max_range' in self.plot_config:
-                self.settings.x_max_range = self.plot_config.get('x_max_range')
-                
-            if 'y_min_range' in self.plot_config:
-                self.settings.y_min_range = self.plot_config.get('y_min_range')
-                
-            if 'y_max_range' in self.plot_config:
-                self.settings.y_max_range = self.plot_config.get('y_max_range')
-            
-            # Apply settings that go directly to self
-            if 'x_feature' in self.plot_config:
-                self.selected_x_channel = int(self.plot_config.get('x_feature'))
-                
-            if 'y_feature' in self.plot_config:
-                self.selected_y_channel = int(self.plot_config.get('y_feature'))
-                
-            if 'logx' in self.plot_config:
-                self.logx = self.plot_config.get('logx')
-                
-            if 'logy' in self.plot_config:
-                self.logy = self.plot_config.get('logy')
-                
-            if 'stats_table' in self.plot_config:
-                self.stats_table = int(self.plot_config.get('stats_table'))
-                
-            if 'x_gain' in self.plot_config:
-                self.x_gain = self.plot_config.get('x_gain')
-                
-            if 'y_gain' in self.plot_config:
-                self.y_gain = self.plot_config.get('y_gain')
-                
-            if 'x_threshold' in self.plot_config:
-                self.x_threshold = float(self.plot_config.get('x_threshold'))
-                
-            if 'y_threshold' in self.plot_config:
-                self.y_threshold = self.plot_config.get('y_threshold')
-                
             if 'current_channels' in self.plot_config:
-                # Convert string representation of list to actual list
-                channels_str = self.plot_config.get('current_channels')
-                self.channel_indices = [int(x.strip()) for x in channels_str]
+                # Accept either a string representation of a list ("[1, 2, 3]") or a sequence
+                channels = self.plot_config.get('current_channels')
+                if isinstance(channels, str):
+                    self.channel_indices = np.array([int(c) for c in channels.strip('[] ').split(',') if c.strip()], dtype=np.int32)
+                else:
+                    self.channel_indices = np.asarray(channels, dtype=np.int32)
+
+            # Reflect the loaded logx/logy in the menu and on the plot
+            self._sync_log_actions()
+            self.plot_widget.setLogMode(x=bool(self.logx), y=bool(self.logy))
             
             # After applying all settings, update the axes
             self.update_axes()
@@ -224,6 +243,8 @@ class PseudocolorPlot(QWidget):
         self.plot_widget = pg.PlotWidget()
         self.plot_widget.showGrid(True, True)
         self.plot_widget.setBackground('w')
+        # Gates are added straight to the ViewBox, so keep a reference instead of looking it up per gate
+        self._view_box = self.plot_widget.getViewBox()
 
         self.plot_widget.setStyleSheet("""
             PlotWidget {
@@ -241,25 +262,16 @@ class PseudocolorPlot(QWidget):
 
     @Slot()
     def on_plot_ready(self):
-        self.backend.update_plot.connect(self.plot_widget.replot, Qt.QueuedConnection)
+        # AutoConnection calls replot directly when the backend emits from this thread and only
+        # queues it when the backend lives on a worker thread (checked at emit time)
+        self.backend.update_plot.connect(self.plot_widget.replot, Qt.AutoConnection)
+        self.start_updates()
 
     def update_axes(self):
         """Update the plot's axes based on the selected channels"""
-        # Cache axis text objects if not already created
-        if not hasattr(self, '_axis_texts'):
-            # Set up fonts and colors once
-            label_font = QFont('Segoe UI', 10, QFont.Bold)
-            
-            # Create and cache QwtText objects
-            self._axis_texts = {
-                str(i): QwtText.make(text=f"Channel {i} Data", font=label_font)
-                for i in range(52)
-            }
-            
-        # Set x-axis title with cached text
-        self.plot_widget.setLabel('bottom', self._axis_texts[str(self.selected_x_channel)])
-        # Set y-axis title with cached text
-        self.plot_widget.setLabel('left', self._axis_texts[str(self.selected_y_channel)])
+        # Axis texts are built on first use and cached per channel across all plots
+        self.plot_widget.setLabel('bottom', _make_axis_text(int(self.selected_x_channel)))
+        self.plot_widget.setLabel('left', _make_axis_text(int(self.selected_y_channel)))
 
     def setup_context_menu(self):
         """Setup the custom context menu"""        
@@ -272,14 +284,13 @@ class PseudocolorPlot(QWidget):
         self.customContextMenuRequested.connect(self.show_context_menu)
 
         log_scaling = self.context_menu.addMenu("Log Scaling")
-        xlog = log_scaling.addAction("Log Scaling on x-axis")
-        xlog.setCheckable(True)
-        if self.logx == 1:
-            xlog.setChecked(True)
-        ylog = log_scaling.addAction("Log Scaling on y-axis")
-        ylog.setCheckable(True)
-        if self.logy == 1:
-            ylog.setChecked(True)
+        self.xlog_action = log_scaling.addAction("Log Scaling on x-axis")
+        self.xlog_action.setCheckable(True)
+        self.ylog_action = log_scaling.addAction("Log Scaling on y-axis")
+        self.ylog_action.setCheckable(True)
+        self._sync_log_actions()
+        self.xlog_action.toggled.connect(self._set_logx)
+        self.ylog_action.toggled.connect(self._set_logy)
 
         # Add the ability to set gates
         gate_action = self.context_menu.addMenu("Add Gate")
@@ -292,6 +303,30 @@ class PseudocolorPlot(QWidget):
         ellipse_gate.triggered.connect(lambda: self.add_gate('ellipse'))
         # polygon_gate.triggered.connect(self.open_polygon_gate_dialog)
 
+    @Slot(bool)
+    def _set_logx(self, checked):
+        self.logx = int(checked)
+        self._apply_log_scaling()
+
+    @Slot(bool)
+    def _set_logy(self, checked):
+        self.logy = int(checked)
+        self._apply_log_scaling()
+
+    def _sync_log_actions(self):
+        """Check the log scaling actions to match logx/logy without triggering their slots"""
+        for action, enabled in ((self.xlog_action, self.logx), (self.ylog_action, self.logy)):
+            action.blockSignals(True)
+            action.setChecked(bool(enabled))
+            action.blockSignals(False)
+
+    def _apply_log_scaling(self):
+        self.plot_widget.setLogMode(x=bool(self.logx), y=bool(self.logy))
+        self.update_axes()
+        # NOTE: The backend is only attached once data is loaded
+        if getattr(self, 'backend', None) is not None:
+            self.backend.update_plot.emit()
+
     def show_context_menu(self, pos):
         """Show the context menu at the cursor position"""
         
@@ -321,14 +356,28 @@ class PseudocolorPlot(QWidget):
             dialog.exec()
             return
             
+        # The dialog is built once and reused; only the spinbox values change between calls
+        if self._features_dialog is None:
+            self._features_dialog = self._build_features_dialog()
+        dialog = self._features_dialog
+        dialog.x_spin.setValue(self.selected_x_channel)
+        dialog.y_spin.setValue(self.selected_y_channel)
+        
+        if dialog.exec():
+            # Update selected channels
+            self.selected_x_channel = dialog.x_spin.value()
+            self.selected_y_channel = dialog.y_spin.value()
+            self.update_axes()
+            self.backend.s_settings_update.emit(self.selected_x_channel, self.selected_y_channel)
+
+    def _build_features_dialog(self):
+        """Build the Select Features dialog; the spinboxes are kept as x_spin/y_spin attributes"""
         # Create main dialog without parent
         dialog = QDialog(None)  # Change from self to None
         dialog.setWindowTitle("Select Features")
         dialog.resize(300, 400)
         dialog.setWindowFlags(Qt.WindowType.WindowStaysOnTopHint)  # Keep dialog on top
         
-        # Rest of the code remains the same...
-        
         # Create main layout for dialog
         main_layout = QVBoxLayout(dialog)
         
@@ -345,18 +394,16 @@ class PseudocolorPlot(QWidget):
         # X feature selection
         x_label = QLabel("X Channel:")
         selection_layout.addWidget(x_label)
-        x_spin = QSpinBox()
-        x_spin.setRange(0, 51)  # 52 channels (0-51)
-        x_spin.setValue(self.selected_x_channel)
-        selection_layout.addWidget(x_spin)
+        dialog.x_spin = QSpinBox()
+        dialog.x_spin.setRange(0, 51)  # 52 channels (0-51)
+        selection_layout.addWidget(dialog.x_spin)
         
         # Y feature selection  
         y_label = QLabel("Y Channel:")
         selection_layout.addWidget(y_label)
-        y_spin = QSpinBox()
-        y_spin.setRange(0, 51)  # 52 channels (0-51)
-        y_spin.setValue(self.selected_y_channel)
-        selection_layout.addWidget(y_spin)
+        dialog.y_spin = QSpinBox()
+        dialog.y_spin.setRange(0, 51)  # 52 channels (0-51)
+        selection_layout.addWidget(dialog.y_spin)
 
         scroll_area.setWidget(selection_widget)
         main_layout.addWidget(scroll_area)
@@ -367,12 +414,7 @@ class PseudocolorPlot(QWidget):
         button_box.rejected.connect(dialog.reject)
         main_layout.addWidget(button_box)
         
-        if dialog.exec():
-            # Update selected channels
-            self.selected_x_channel = x_spin.value()
-            self.selected_y_channel = y_spin.value()
-            self.update_axes()
-            self.backend.s_settings_update.emit(self.selected_x_channel, self.selected_y_channel)
+        return dialog
 
     def handle_gate_selection(self, gate_id, selected):
         """Handle a gate being selected"""
@@ -405,10 +447,12 @@ class PseudocolorPlot(QWidget):
                 
         @return void
         """
-        if len(self.roi_dict) == 0:
+        if not self.roi_dict:
             return
-        list(self.roi_dict.values())[-1].remove()
-        self.roi_dict.pop(list(self.roi.keys())[-1])
+        # dicts keep insertion order, so popitem() takes the most recently added gate
+        gate_id, roi = self.roi_dict.popitem()
+        self._view_box.removeItem(roi)
+        self.gate_removed.emit(roi, gate_id)
         # TODO: This base_config part is in relation to the configuration that we would open when
         #       starting the program. It serves the same role as the config used to automatically
         #       load plots on startup. As such, it will need to be integrated later.
@@ -419,38 +463,25 @@ class PseudocolorPlot(QWidget):
     def add_gate(self, shape=None, values: Optional[dict] = None):
         """Add a gate to the pseudocolor plot"""
         try:
-            # Get the ViewBox explicitly
-            view_box = self.plot_widget.getViewBox()
+            view_box = self._view_box
             if not view_box:
                 logger.error("Cannot add gate: No ViewBox found")
                 return
             
-            # Calculate position based on current view
-            view_range = view_box.viewRange()
-            x_center = (view_range[0][0] + view_range[0][1]) / 2
-            y_center = (view_range[1][0] + view_range[1][1]) / 2
-            width = (view_range[0][1] - view_range[0][0]) * 0.2  # 20% of view width
-            height = (view_range[1][1] - view_range[1][0]) * 0.2  # 20% of view height
+            # Center the gate in the current view at 20% of the view width/height
+            view_range = np.asarray(view_box.viewRange())
+            size = (view_range[:, 1] - view_range[:, 0]) * 0.2
+            pos = view_range.mean(axis=1) - size / 2
             
             # Create ROI based on shape type
-            if shape == 'ellipse':
-                roi = pg.EllipseROI(
-                    pos=[x_center - width/2, y_center - height/2],
-                    size=[width, height],
-                    pen=pg.mkPen('r', width=2)
-                )
-            else:  # Default to rectangle
-                roi = pg.RectROI(
-                    pos=[x_center - width/2, y_center - height/2],
-                    size=[width, height],
-                    pen=pg.mkPen('r', width=2)
-                )
+            roi_type = pg.EllipseROI if shape == 'ellipse' else pg.RectROI  # Default to rectangle
+            roi = roi_type(pos=pos.tolist(), size=size.tolist(), pen=pg.mkPen('r', width=2))
             
             # Add directly to the ViewBox
             view_box.addItem(roi)
             
             # Store reference in dictionary
-            gate_id = str(uuid.uuid4())
+            gate_id = uuid.uuid4().hex
             self.roi_dict[gate_id] = roi
             
             return roi